@@ -1,49 +1,27 @@
+import array as _array
 import bisect as _bisect
 import itertools as _itertools
-from operator import index as _index
+from operator import index as _index, lt as _lt
 from sys import maxsize as _maxsize
 
 
-class SortedList(list):
+class _SortedSequence:
     """
-    A list that maintains its items in ascending order.
-
-    Items are expected to be comparable in a consistent way.  The ordering is
-    stable and newly inserted items follow existing ones. Only `<` comparison
-    is used between items, matching the built-in `sort` behavior.
-
-    Many standard list operations are available, but some have been disabled
-    due to their incompatibility with the semantics of a sorted list.
-
-    Example
-    -------
-    >>> sl = SortedList([5, 1, 3])
-    >>> sl
-    SortedList([1, 3, 5])
-    >>> sl.append(4)
-    >>> sl
-    SortedList([1, 3, 4, 5])
+    Operations shared by `SortedList` and `SortedArray`.
 
-    Performance notes
-    -----------------
-    Binary search is used where applicable to improve performance. Note that
-    insertion and deletion still require shifting, as with the built-in list.
+    Subclasses set `_base` to the built-in sequence type they extend, call
+    its methods through it, and implement `_like` to build a plain sequence
+    of that type and `_sort` to sort all items in place.
     """
 
-    def __init__(self, items=()):
-        list.__init__(self, items)
-        list.sort(self)
-    
-    def __getitem__(self, index):
-        if not isinstance(index, slice):
-            return list.__getitem__(self, index)
-        result = list.__new__(SortedList)
-        result.extend(_itertools.islice(self, *index.indices(len(self))))
-        return result
+    _base = None
     
     def __contains__(self, item):
-        index = _bisect.bisect_left(self, item)
-        for other in map(self.__getitem__, range(index, len(self))):
+        # Equivalent items are compared with `==`, as the built-in list does.
+        # For a total order the first one decides.
+        getitem = self._base.__getitem__
+        for index in range(_bisect.bisect_left(self, item), len(self)):
+            other = getitem(self, index)
             if item == other:
                 return True
             if item < other:
@@ -53,48 +31,59 @@ class SortedList(list):
     __setitem__ = None
     
     def __add__(self, other):
-        if not isinstance(other, list):
+        if not isinstance(other, (list, self._base)):
             return NotImplemented
-        result = list.__new__(SortedList)
-        list.extend(result, _itertools.chain(self, other))
-        n = len(result) - len(self)
-        if n == 1:
-            item = result.pop()
-            index = _bisect.bisect(result, item)
-            list.insert(result, index, item)
+        result = self.copy()
+        n = len(result)
+        self._base.extend(result, other)
+        # Two sorted sequences that do not overlap are already in order.
+        # Otherwise sorting finds both runs and merges them in C.
+        getitem = self._base.__getitem__
+        if isinstance(other, _SortedSequence) and (
+                n == 0 or n == len(result) or not getitem(result, n) < getitem(result, n - 1)):
             return result
-        if n:
-            list.sort(result)
+        result._sort_tail(n)
         return result
     
     def __iadd__(self, items):
-        n = len(self)
-        list.__iadd__(self, items)
-        n -= len(self)
-        if n != -1:
-            if n:
-                list.sort(self)
-            return
-        item = self.pop()
-        index = _bisect.bisect(self, item)
-        list.insert(self, index, item)
+        self.extend(items)
+        return self
     
     def __mul__(self, n):
-        result = list.__new__(SortedList)
-        list.extend(result, _itertools.chain.from_iterable(_itertools.repeat(item, n) for item in self))
+        result = self.copy()
+        self._base.__imul__(result, n)
+        result._repeat(self, n)
         return result
     
     __rmul__ = __mul__
     
     def __imul__(self, n):
-        data = list.copy(self)
-        list.__init__(self, _itertools.chain.from_iterable(_itertools.repeat(item, n) for item in data))
+        items = self._like(self)
+        self._base.__imul__(self, n)
+        self._repeat(items, n)
+        return self
+    
+    def _repeat(self, items, n):
+        # Overwrite the sequence, already grown to `n` times the size of
+        # `items`, with every item repeated `n` times in a row. The slice
+        # assignments loop over whichever of `n` and the number of items is
+        # smaller.
+        setitem = self._base.__setitem__
+        if len(items) < n:
+            for index, item in enumerate(items):
+                setitem(self, slice(index * n, index * n + n), self._like([item]) * n)
+        else:
+            for index in range(n):
+                setitem(self, slice(index, None, n), items)
+    
+    def _is_sorted(self):
+        return not any(map(_lt, _itertools.islice(self, 1, None), self))
     
     def index(self, item, start=0, stop=_maxsize):
         stop = min(len(self), _index(stop))
-        index = _bisect.bisect_left(self, item, start, stop)
-        for index in range(index, stop):
-            other = self[index]
+        getitem = self._base.__getitem__
+        for index in range(_bisect.bisect_left(self, item, start, stop), stop):
+            other = getitem(self, index)
             if item == other:
                 return index
             if item < other:
@@ -102,46 +91,276 @@ class SortedList(list):
         raise ValueError
     
     def count(self, item):
-        result = 0
         index = _bisect.bisect_left(self, item)
-        for other in map(self.__getitem__, range(index, len(self))):
-            if item == other:
-                result += 1
-            if item < other:
-                return result
-        return result
-    
-    def copy(self):
-        result = list.__new__(SortedList)
-        list.extend(result, self)
-        return result
+        stop = _bisect.bisect_right(self, item, index)
+        return self._base.__getitem__(self, slice(index, stop)).count(item)
     
-    insert = reverse = sort = None
+    insert = reverse = None
     
     def append(self, item):
-        index = _bisect.bisect(self, item)
-        list.insert(self, index, item)
+        # `bisect.insort` cannot be used: on subclasses it calls the disabled
+        # `insert` method instead of inserting directly.
+        self._base.insert(self, _bisect.bisect_right(self, item), item)
     
     def extend(self, items):
+        # Convert first, so that an error while iterating or converting the
+        # items appends nothing.
+        items = self._like(items)
         n = len(self)
-        list.extend(self, items)
-        n -= len(self)
-        if n != -1:
-            if n:
-                list.sort(self)
-            return
-        item = self.pop()
-        index = _bisect.bisect(self, item)
-        list.insert(self, index, item)
+        self._base.extend(self, items)
+        self._sort_tail(n)
+    
+    def _sort_tail(self, n):
+        # Sort the items appended after the first `n`. Sorting compares every
+        # item, while inserting only compares about log2(n) times per item
+        # but shifts the rest, so insert a few items into a long sequence.
+        k = len(self) - n
+        if k == 1 or k <= 32 and k * k << 8 < n:
+            items = self._base.__getitem__(self, slice(n, None))
+            del self[n:]
+            insert = self._base.insert
+            for item in items:
+                insert(self, _bisect.bisect_right(self, item), item)
+        elif k:
+            self._sort()
     
     def remove(self, item):
-        index = _bisect.bisect_left(self, item)
-        for index in range(index, len(self)):
-            other = self[index]
+        getitem = self._base.__getitem__
+        for index in range(_bisect.bisect_left(self, item), len(self)):
+            other = getitem(self, index)
             if item == other:
-                del self[index]
+                self._base.__delitem__(self, index)
                 return
             if item < other:
                 break
         raise ValueError
+    
+    def remove_many(self, items):
+        """
+        Remove one occurrence of each of the given items.
+
+        This is equivalent to calling `remove` for each item, but the items
+        are rebuilt in a single pass instead of being shifted once per item.
+        If any item is missing, `ValueError` is raised and the list or array
+        is left unchanged.
 
+        Example
+        -------
+        >>> sl = SortedList([1, 2, 2, 3, 3, 3])
+        >>> sl.remove_many([3, 2, 3])
+        >>> list(sl)
+        [1, 2, 3]
+        >>> sl.remove_many([1, 4])
+        Traceback (most recent call last):
+          ...
+        ValueError
+        >>> list(sl)
+        [1, 2, 3]
+        """
+        getitem = self._base.__getitem__
+        removed = set()
+        previous = index = None
+        for item in sorted(items):
+            # Items are matched with `==` as in `remove`. Repeated items
+            # continue after the previous match instead of searching again.
+            if index is not None and item == previous:
+                start = index + 1
+            else:
+                start = _bisect.bisect_left(self, item)
+            for index in range(start, len(self)):
+                if index in removed:
+                    continue
+                other = getitem(self, index)
+                if item == other:
+                    break
+                if item < other:
+                    raise ValueError
+            else:
+                raise ValueError
+            removed.add(index)
+            previous = item
+        survivors = self._like(())
+        start = 0
+        for index in sorted(removed):
+            survivors += getitem(self, slice(start, index))
+            start = index + 1
+        survivors += getitem(self, slice(start, None))
+        self._base.__setitem__(self, slice(None), survivors)
+
+
+class SortedList(_SortedSequence, list):
+    """
+    A list that maintains its items in ascending order.
+
+    Items are expected to be comparable in a consistent way.  The ordering is
+    stable and newly inserted items follow existing ones. Only `<` comparison
+    is used between items, matching the built-in `sort` behavior.
+
+    Many standard list operations are available, but some have been disabled
+    due to their incompatibility with the semantics of a sorted list.
+
+    Example
+    -------
+    >>> sl = SortedList([5, 1, 3])
+    >>> sl
+    SortedList([1, 3, 5])
+    >>> sl.append(4)
+    >>> sl
+    SortedList([1, 3, 4, 5])
+
+    Performance notes
+    -----------------
+    Binary search is used where applicable to improve performance. Note that
+    insertion and deletion still require shifting, as with the built-in list.
+    Items are deliberately kept in a single flat list so that a `SortedList`
+    is a genuine `list`; prefer `extend` and `remove_many` over repeated
+    `append` and `remove` calls when many items change at once.
+
+    Indexing is inherited from `list` unchanged, so that the binary searches
+    read items directly. Slicing with `[]` therefore returns a plain `list`;
+    use `slice` to get a `SortedList` instead.
+    """
+
+    _base = list
+    
+    def __init__(self, items=()):
+        list.__init__(self, items)
+        if not isinstance(items, SortedList):
+            list.sort(self)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({list.__repr__(self)})"
+    
+    def slice(self, start=None, stop=None, step=None):
+        """
+        Return the items selected by `self[start:stop:step]` as a sorted list.
+
+        Example
+        -------
+        >>> list(SortedList([5, 1, 3, 4]).slice(None, None, -2))
+        [3, 5]
+        """
+        # A slice of a sorted list is sorted, or reversed for negative steps.
+        index = slice(start, stop, step)
+        result = SortedList.from_sorted(list.__getitem__(self, index), _unchecked=True)
+        if index.indices(0)[2] < 0:
+            list.reverse(result)
+        return result
+    
+    def copy(self):
+        return SortedList.from_sorted(self, _unchecked=True)
+    
+    @classmethod
+    def from_sorted(cls, items, _unchecked=False):
+        """
+        Create a sorted list from items that are already in ascending order.
+
+        The items are not sorted again. Their order is verified by an
+        assertion unless `_unchecked` is true, in which case it is trusted.
+
+        Example
+        -------
+        >>> sl = SortedList.from_sorted([1, 2, 2, 5])
+        >>> list(sl)
+        [1, 2, 2, 5]
+        >>> SortedList.from_sorted(list(sl)) == sl
+        True
+        """
+        result = list.__new__(cls)
+        list.extend(result, items)
+        assert _unchecked or result._is_sorted(), "items are not sorted"
+        return result
+    
+    sort = None
+    
+    def _like(self, items):
+        return list(items)
+    
+    _sort = list.sort
+
+
+class SortedArray(_SortedSequence, _array.array):
+    """
+    An array that maintains its items in ascending order.
+
+    This is a compact counterpart of `SortedList` for numbers of a single
+    type, which are stored unboxed as specified by an `array` typecode. It
+    provides the same operations as `SortedList`, and like it can be added
+    to lists as well as arrays; methods of `array` that would break the
+    ordering have been disabled.
+
+    Example
+    -------
+    >>> sa = SortedArray('q', [5, 1, 3])
+    >>> sa
+    SortedArray('q', [1, 3, 5])
+    >>> sa.append(4)
+    >>> sa
+    SortedArray('q', [1, 3, 4, 5])
+    >>> sa.slice(None, None, -2)
+    SortedArray('q', [3, 5])
+    >>> sa * 2
+    SortedArray('q', [1, 1, 3, 3, 4, 4, 5, 5])
+    >>> sa.remove(3)
+    >>> sa
+    SortedArray('q', [1, 4, 5])
+
+    Performance notes
+    -----------------
+    Items take 1 to 8 bytes each instead of a pointer to a boxed object, so
+    shifting on insertion and deletion moves several times less memory than
+    with `SortedList`. Items are boxed temporarily when compared. As with
+    `SortedList`, slicing with `[]` returns a plain `array`; use `slice` to
+    get a `SortedArray`.
+    """
+
+    _base = _array.array
+    
+    def __new__(cls, typecode, items=()):
+        self = _array.array.__new__(cls, typecode, items)
+        if not isinstance(items, SortedArray):
+            self._sort()
+        return self
+    
+    def slice(self, start=None, stop=None, step=None):
+        """
+        Return the items selected by `self[start:stop:step]` as a sorted array.
+        """
+        index = slice(start, stop, step)
+        result = SortedArray.from_sorted(self.typecode, _array.array.__getitem__(self, index), _unchecked=True)
+        if index.indices(0)[2] < 0:
+            _array.array.reverse(result)
+        return result
+    
+    def copy(self):
+        return SortedArray.from_sorted(self.typecode, self, _unchecked=True)
+    
+    __copy__ = copy
+    
+    def __deepcopy__(self, memo):
+        # Items are plain numbers, so a shallow copy is also a deep one.
+        return self.copy()
+    
+    @classmethod
+    def from_sorted(cls, typecode, items, _unchecked=False):
+        """
+        Create a sorted array from items that are already in ascending order.
+
+        As with `SortedList.from_sorted`, the order is asserted unless
+        `_unchecked` is true.
+        """
+        result = _array.array.__new__(cls, typecode, items)
+        assert _unchecked or result._is_sorted(), "items are not sorted"
+        return result
+    
+    byteswap = frombytes = fromfile = fromlist = fromunicode = None
+    
+    def _like(self, items):
+        # Iterate over the items: the constructor would read bytes-like
+        # objects as raw machine values.
+        result = _array.array(self.typecode)
+        result.extend(items)
+        return result
+    
+    def _sort(self):
+        _array.array.__setitem__(self, slice(None), _array.array(self.typecode, sorted(self)))